@@ -7,19 +7,37 @@ Applies the rules that live in `tangolint_rules.py`
 
 import argparse
 import ast
+import functools
+import hashlib
+import heapq
+import io
+import os
+import pickle
 import sys
 import re
+import tokenize
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 import subprocess
 
 import json
+from itertools import filterfalse
+from operator import itemgetter
 from shutil import which
+from typing import Any, Callable, Iterable, Iterator
 
 import tangolint_rules as rules
 
-@dataclass
+__version__ = "0.1.2"
+
+#: Most entries kept in the `cache_dir`. Every saved revision of a file adds
+#: entries, so once there are more, the least recently used are deleted
+#: down to three quarters of this.
+CACHE_MAX_ENTRIES = 1000
+
+@dataclass(slots=True)
 class LintIssue:
     """Represents a linting issue found in the code."""
 
@@ -30,8 +48,61 @@ class LintIssue:
     message: str
 
 
-class TangoLinter(ast.NodeVisitor):
-    """AST visitor that dispatches nodes to registered lint rules."""
+#: Lightweight issue record used while linting, in `LintIssue` field order.
+#: Only issues that survive noqa filtering are turned into `LintIssue`s.
+RawIssue = tuple[int, int, str, str, str]
+
+#: Sort key for `RawIssue`: (line, column).
+_issue_key = itemgetter(0, 1)
+
+_FUNC_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+#: node_type -> ((check, severity, code), ...)
+RuleMap = dict[type, tuple[tuple[Callable[..., Any], str, str], ...]]
+
+
+def _flatten_rule_map(
+    rule_map: dict[type, list[rules.ASTRule]],
+    device_class: bool,
+    attribute: bool = False,
+) -> RuleMap:
+    """Build a flattened dispatch table of the rules that apply in one scope."""
+    table: RuleMap = {}
+    for node_type, rs in rule_map.items():
+        entries = tuple(
+            (r.check, r.severity, r.code)
+            for r in dict.fromkeys(rs)
+            if (device_class or not r.device_class_only)
+            and (attribute or not r.requires_tango_attribute)
+        )
+        if entries:
+            table[node_type] = entries
+    return table
+
+
+@functools.lru_cache(maxsize=8)
+def _build_rule_maps(
+    disabled: frozenset[str], ast_rules: tuple[rules.ASTRule, ...]
+) -> tuple[RuleMap, RuleMap, RuleMap]:
+    """Return the (device class, global, attribute) dispatch tables."""
+    # Cached and shared between linters, so never mutated; *ast_rules* is in
+    # the key so that rules registered later are picked up. The rules module
+    # keeps the per-type index (including the mirroring of FunctionDef rules
+    # onto AsyncFunctionDef); only filter it here.
+    rule_map = {
+        node_type: [r for r in type_rules if r.code not in disabled]
+        for node_type, type_rules in rules.get_ast_rules_by_type().items()
+    }
+    return (
+        _flatten_rule_map(rule_map, device_class=True),
+        _flatten_rule_map(rule_map, device_class=False),
+        _flatten_rule_map(rule_map, device_class=True, attribute=True),
+    )
+
+
+class TangoLinter:
+    """AST walker that dispatches nodes to registered lint rules."""
 
     #: Tango base class names used to detect device classes.
     _TANGO_BASES = frozenset(
@@ -43,109 +114,179 @@ class TangoLinter(ast.NodeVisitor):
             "SKADevice",
         ]
     )
+    #: Substring match against any of ``_TANGO_BASES`` in a single C-level
+    #: scan, so subclasses such as ``SKABaseDevice`` are still recognised.
+    _TANGO_BASE_RE = re.compile("|".join(map(re.escape, sorted(_TANGO_BASES))))
+
+    #: Node types with a dedicated entry handler, mapped to its method name.
+    _DISPATCH: dict[type, str] = {
+        ast.ClassDef: "visit_ClassDef",
+        ast.FunctionDef: "visit_FunctionDef",
+        ast.AsyncFunctionDef: "visit_AsyncFunctionDef",
+        ast.AnnAssign: "visit_AnnAssign",
+    }
 
     def __init__(self, filename: str, disabled_rules: set[str] | None = None):
         self.filename = filename
         self.disabled_rules = disabled_rules or set()
-        self.issues: list[LintIssue] = []
+        self.raw_issues: list[RawIssue] = []
         self.current_class: str | None = None
-        self.has_tango_import = False
-        self.tango_import_name: str | None = None
         self.attribute_names: set[str] = set()
         self.command_names: set[str] = set()
         self.property_names: set[str] = set()
         self.in_device_class = False
 
-        # Build dispatch table: node_type -> [rule, ...]
-        self._rule_map: dict[type, list[rules.ASTRule]] = {}
-        for rule in rules.get_ast_rules():
-            if rule.code in self.disabled_rules:
-                continue
-            for node_type in rule.handles:
-                self._rule_map.setdefault(node_type, []).append(rule)
-                # Async functions share the same rules as regular functions.
-                if node_type is ast.FunctionDef:
-                    self._rule_map.setdefault(
-                        ast.AsyncFunctionDef, []
-                    ).append(rule)
-
-    def _ctx(self) -> rules.RuleContext:
-        """Return a base RuleContext from the current linter state."""
-        return rules.RuleContext(
-            in_device_class=self.in_device_class,
-            current_class=self.current_class,
+        # Dispatch tables: every rule (inside a device class) and only the
+        # rules that can fire outside one, so e.g. T-rules are never even
+        # called on module-level functions.
+        (
+            self._device_rule_map,
+            self._global_rule_map,
+            self._attribute_rule_map,
+        ) = _build_rule_maps(
+            frozenset(self.disabled_rules), rules.get_ast_rules()
         )
+        #: Table for the current scope; switched by visit_ClassDef.
+        self._rule_map = self._global_rule_map
+
+        # Bound entry handlers by node type, resolved once so the walk needs
+        # neither a "visit_" + name string nor a getattr per node.
+        self._enter = {t: getattr(self, name) for t, name in self._DISPATCH.items()}
+
+        # One context object for the whole walk, rather than a new
+        # RuleContext per node. Its class scope is only written on entering
+        # and leaving a class (see _set_scope), not re-synced per node.
+        self._ctx_obj = rules.RuleContext()
+
+    def _get_name(self, node: ast.expr) -> str:
+        """`rules.get_name`, memoised in the context shared with the rules."""
+        return rules.get_name(node, self._ctx_obj.name_cache)
+
+    @property
+    def issues(self) -> list[LintIssue]:
+        """Issues found so far, as `LintIssue` objects."""
+        return [LintIssue(*raw) for raw in self.raw_issues]
+
+    def _set_scope(
+        self, current_class: str | None, in_device_class: bool, rule_map: RuleMap
+    ) -> None:
+        """Switch class scope, in both the linter and the shared context."""
+        self.current_class = current_class
+        self.in_device_class = in_device_class
+        self._rule_map = rule_map
+        ctx = self._ctx_obj
+        ctx.current_class = current_class
+        ctx.in_device_class = in_device_class
 
     def _run(self, node: ast.AST, ctx: rules.RuleContext) -> None:
         """Dispatch all applicable rules for *node* with *ctx*."""
-        for rule in self._rule_map.get(type(node), []):
-            for violation_node, message in rule.check(node, ctx):
-                self.issues.append(
-                    LintIssue(
-                        line=getattr(violation_node, "lineno", 0),
-                        column=getattr(violation_node, "col_offset", 0),
-                        severity=rule.severity,
-                        code=rule.code,
-                        message=message,
-                    )
-                )
-
-    def generic_visit(self, node: ast.AST) -> None:
-        """Dispatch rules for nodes without a dedicated visit_ method."""
-        self._run(node, self._ctx())
-        ast.NodeVisitor.generic_visit(self, node)
-
-    def visit_Import(self, node: ast.Import) -> None:
-        for alias in node.names:
-            if "tango" in alias.name:
-                self.has_tango_import = True
-                self.tango_import_name = alias.asname or alias.name
-        self._run(node, self._ctx())
-        ast.NodeVisitor.generic_visit(self, node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        if node.module and "tango" in node.module:
-            self.has_tango_import = True
-            if node.module == "tango.server":
-                self.tango_import_name = "tango.server"
-        self._run(node, self._ctx())
-        ast.NodeVisitor.generic_visit(self, node)
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:
-        old_class, old_in_device = self.current_class, self.in_device_class
-        self.current_class = node.name
-
+        append = self.raw_issues.append
+        for check, severity, code in self._rule_map.get(type(node), ()):
+            # Rules return a list (or None when clean) or are generators.
+            hits = check(node, ctx)
+            if not hits:
+                continue
+            for violation_node, message in hits:
+                append((
+                    getattr(violation_node, "lineno", 0),
+                    getattr(violation_node, "col_offset", 0),
+                    severity,
+                    code,
+                    message,
+                ))
+
+    def visit(self, node: ast.AST) -> None:
+        """Walk *node* with an explicit stack, dispatching rules in pre-order."""
+        AST = ast.AST
+        get_enter = self._enter.get
+        ctx = self._ctx_obj
+        stack: list[Any] = [node]
+        pop, push = stack.pop, stack.extend
+        while stack:
+            item = pop()
+            if not isinstance(item, AST):
+                item()  # scope exit
+                continue
+            enter = get_enter(type(item))
+            if enter is not None:
+                leave = enter(item)
+                if leave is not None:
+                    stack.append(leave)
+            elif type(item) in self._rule_map:
+                self._run(item, ctx)
+            # Same children, in the same order, as ast.iter_child_nodes, but
+            # without a generator; reversed so they pop off in source order.
+            children = []
+            for field in item._fields:
+                value = getattr(item, field, None)
+                if isinstance(value, AST):
+                    children.append(value)
+                elif isinstance(value, list):
+                    children.extend([v for v in value if isinstance(v, AST)])
+            children.reverse()
+            push(children)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> Callable[[], None]:
+        saved = (self.current_class, self.in_device_class, self._rule_map)
+
+        get_name = self._get_name
         base_names: list[str] = []
         for base in node.bases:
             if isinstance(base, ast.Attribute):
-                base_names.append(f"{rules.get_name(base.value)}.{base.attr}")
+                base_names.append(f"{get_name(base.value)}.{base.attr}")
             elif isinstance(base, ast.Name):
                 base_names.append(base.id)
 
-        self.in_device_class = any(
-            any(tb in bn for tb in self._TANGO_BASES) for bn in base_names
+        match_base = self._TANGO_BASE_RE.search
+        in_device_class = any(match_base(bn) for bn in base_names)
+        self._set_scope(
+            node.name,
+            in_device_class,
+            self._device_rule_map if in_device_class else self._global_rule_map,
         )
 
-        self._run(node, self._ctx())
-        ast.NodeVisitor.generic_visit(self, node)
-        self.current_class, self.in_device_class = old_class, old_in_device
+        ctx = self._ctx_obj
+        if in_device_class:
+            # Shared by the ClassDef rules that look up sibling methods.
+            ctx.method_names = frozenset(
+                item.name for item in node.body if isinstance(item, _FUNC_NODES)
+            )
+        self._run(node, ctx)
+
+        def leave() -> None:
+            self._set_scope(*saved)
+
+        return leave
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        ctx = self._ctx()
-        if self.in_device_class:
+        ctx = self._ctx_obj
+        if self.in_device_class and node.decorator_list:
             for decorator in node.decorator_list:
-                dec_info = rules.get_decorator_info(decorator)
-                if dec_info:
-                    dec_name, kwargs = dec_info
-                    if "attribute" in dec_name:
-                        ctx.is_tango_attribute = True
-                        ctx.attribute_config = kwargs
-                        self.attribute_names.add(node.name)
-                    elif "command" in dec_name:
-                        ctx.is_tango_command = True
-                        self.command_names.add(node.name)
-        self._run(node, ctx)
-        ast.NodeVisitor.generic_visit(self, node)
+                # Matched on the last segment, so module aliases such as
+                # ``@ts.attribute`` are recognised too.
+                kind = rules.decorator_kind(decorator, ctx.name_cache)
+                if kind == "attribute":
+                    ctx.is_tango_attribute = True
+                    # Only read the kwargs of decorators we care about.
+                    if isinstance(decorator, ast.Call):
+                        ctx.attribute_config = rules.AttributeConfig.from_kwargs(
+                            rules.get_call_kwargs(decorator)
+                        )
+                    self.attribute_names.add(node.name)
+                elif kind == "command":
+                    ctx.is_tango_command = True
+                    self.command_names.add(node.name)
+        if ctx.is_tango_attribute:
+            # Only @attribute methods see the attribute-only rules.
+            self._rule_map = self._attribute_rule_map
+            self._run(node, ctx)
+            self._rule_map = self._device_rule_map
+        else:
+            self._run(node, ctx)
+        # Function-level state must not leak into the body or later siblings.
+        if ctx.is_tango_attribute or ctx.is_tango_command:
+            ctx.is_tango_attribute = ctx.is_tango_command = False
+            ctx.attribute_config = rules.NO_ATTRIBUTE_CONFIG
 
     visit_AsyncFunctionDef = visit_FunctionDef  # type: ignore[assignment]
 
@@ -154,32 +295,55 @@ class TangoLinter(ast.NodeVisitor):
             self.in_device_class
             and isinstance(node.target, ast.Name)
             and isinstance(node.value, ast.Call)
-            and "device_property" in rules.get_name(node.value.func)
+            and "device_property" in self._get_name(node.value.func)
         ):
             self.property_names.add(node.target.id)
-        self._run(node, self._ctx())
-        ast.NodeVisitor.generic_visit(self, node)
+        self._run(node, self._ctx_obj)
+
+
+_NOQA_RE = re.compile(r"#\s*noqa(?::\s*([A-Z0-9,\s]+))?", re.IGNORECASE)
 
+#: Cache-miss marker for noqa lookups (``None`` already means "bare noqa").
+_MISSING = object()
 
-def _parse_noqa(source: str) -> dict[int, set[str] | None]:
-    """Parse noqa annotations.
 
-    Returns a dict as a map to:
+def _parse_noqa_line(line: str) -> frozenset[str] | None:
+    """Parse the noqa annotation on a single source line.
+
+    Returns:
     - `None`        — suppress all issues on that line (i.e. if there is a `# noqa`)
-    - `set[str]`    — suppress only the listed codes  (i.e. `# noqa: T023, G001`)
+    - `frozenset`   — suppress only the listed codes  (i.e. `# noqa: T023, G001`);
+                      empty when the line has no noqa annotation at all
     """
-    noqa: dict[int, set[str] | None] = {}
-    pattern = re.compile(r"#\s*noqa(?::\s*([A-Z0-9,\s]+))?", re.IGNORECASE)
-    for lineno, line in enumerate(source.splitlines(), start=1):
-        m = pattern.search(line)
-        if not m:
-            continue
-        if m.group(1):
-            codes = {c.strip().upper() for c in m.group(1).split(",") if c.strip()}
-            noqa[lineno] = codes
-        else:
-            noqa[lineno] = None  # bare # noqa — suppress everything
-    return noqa
+    # Cheap substring test first: most lines carrying an issue have no comment.
+    m = _NOQA_RE.search(line) if "#" in line else None
+    if not m:
+        return frozenset()
+    if m.group(1):
+        return frozenset(
+            c.strip().upper() for c in m.group(1).split(",") if c.strip()
+        )
+    return None  # bare # noqa — suppress everything
+
+
+def _filter_noqa(
+    issues: Iterable[RawIssue], src: rules.SourceContext
+) -> Iterator[RawIssue]:
+    """Lazily drop issues suppressed by a noqa comment on their line."""
+    noqa: dict[int, frozenset[str] | None] = {}
+
+    def _suppressed(issue: RawIssue) -> bool:
+        line, code = issue[0], issue[3]
+        suppression = noqa.get(line, _MISSING)
+        if suppression is _MISSING:
+            lines = src.lines
+            in_range = 0 < line <= len(lines)
+            suppression = noqa[line] = (
+                _parse_noqa_line(lines[line - 1]) if in_range else frozenset()
+            )
+        return suppression is None or code in suppression  # type: ignore[operator]
+
+    return filterfalse(_suppressed, issues)
 
 def run_tool(command: list[str]) -> subprocess.CompletedProcess:
     return subprocess.run(
@@ -269,22 +433,196 @@ def run_mypy(mypy_cmd: list[str], filepath: Path) -> list[LintIssue]:
     except Exception as e:
         return []
 
+#: Compound statements whose bodies still count as module level.
+_MODULE_BLOCKS = (ast.If, ast.Try, ast.With) + (
+    (ast.TryStar,) if hasattr(ast, "TryStar") else ()
+)
+
+
+def _imports_tango(tree: ast.Module) -> bool:
+    """Return True if the module imports tango at module level."""
+    stack: list[ast.stmt] = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Import):
+            if any("tango" in alias.name for alias in node.names):
+                return True
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and "tango" in node.module:
+                return True
+        elif isinstance(node, _MODULE_BLOCKS):
+            stack.extend(node.body)
+            stack.extend(getattr(node, "orelse", ()))
+            stack.extend(getattr(node, "finalbody", ()))
+            for handler in getattr(node, "handlers", ()):
+                stack.extend(handler.body)
+    return False
+
+
+@functools.lru_cache(maxsize=None)
+def cache_dir() -> Path | None:
+    """Directory for cached ASTs and results, or ``None`` if there is no home."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base:
+        try:
+            base = Path.home() / ".cache"
+        except RuntimeError:
+            return None  # e.g. HOME unset and no passwd entry: cache disabled
+    return Path(base) / "tangolint"
+
+
+def _cache_load(cache_file: Path) -> Any:
+    """Return the object pickled in *cache_file*, or ``None`` on any failure."""
+    try:
+        with cache_file.open("rb") as f:
+            obj = pickle.load(f)
+    except Exception:
+        return None
+    try:
+        os.utime(cache_file)  # mark as recently used for _cache_prune
+    except OSError:
+        pass
+    return obj
+
+
+def _cache_store(cache_file: Path, obj: Any) -> None:
+    """Pickle *obj* to *cache_file*, ignoring errors."""
+    # Write then rename so a concurrent reader never sees a partial pickle.
+    tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_file)
+        _cache_prune(cache_file.parent)
+    except Exception:
+        # The cache is best-effort: a read-only home dir, or an AST too deep
+        # to pickle (RecursionError), must not break linting.
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _cache_prune(directory: Path) -> None:
+    """Delete the least recently used entries once `CACHE_MAX_ENTRIES` is hit."""
+    with os.scandir(directory) as it:
+        entries = list(it)
+    if len(entries) <= CACHE_MAX_ENTRIES:
+        return
+    by_age = []
+    for entry in entries:
+        try:
+            by_age.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            pass  # removed by a concurrent run
+    by_age.sort()
+    for _, path in by_age[: len(by_age) - CACHE_MAX_ENTRIES * 3 // 4]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _ast_cache_file(key: str) -> Path:
+    """Cache entry for the AST of the source whose SHA-256 digest is *key*."""
+    py_version = "{}.{}".format(*sys.version_info[:2])
+    return cache_dir() / f"{key}-py{py_version}-{__version__}.ast"
+
+
+def _parse_cached(
+    filepath: Path, content: bytes, cache_file: Path | None = None
+) -> tuple[ast.Module, bool]:
+    """Parse *content* or load its AST from *cache_file*; say if it was loaded."""
+    if cache_file is not None:
+        tree = _cache_load(cache_file)
+        if tree is not None:
+            return tree, True
+    return ast.parse(content, filename=str(filepath)), False
+
+
+@functools.lru_cache(maxsize=8)
+def _rules_fingerprint(
+    disabled: frozenset[str],
+    ast_rules: tuple[rules.ASTRule, ...],
+    source_rules: tuple[rules.SourceRule, ...],
+) -> str:
+    """Hash everything besides the file itself that decides a lint result."""
+    # AST positions can differ between Python versions.
+    digest = hashlib.sha256()
+    digest.update("py{}.{};".format(*sys.version_info[:2]).encode())
+    for module_file in (__file__, rules.__file__):
+        try:
+            digest.update(Path(module_file).read_bytes())
+        except OSError:
+            digest.update(__version__.encode())
+    for rule in (*ast_rules, *source_rules):
+        digest.update(
+            f"{type(rule).__qualname__}:{rule.code}:{rule.severity}:"
+            f"{getattr(rule, 'max_length', '')};".encode()
+        )
+    digest.update(",".join(sorted(disabled)).encode())
+    return digest.hexdigest()
+
+
+def clear_cache() -> int:
+    """Delete every entry in `cache_dir`; return how many files were removed."""
+    removed = 0
+    directory = cache_dir()
+    if directory is None:
+        return 0
+    try:
+        entries = list(directory.iterdir())
+    except OSError:
+        return 0  # nothing cached yet
+    for entry in entries:
+        try:
+            entry.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
 def lint_file(
     filepath: Path, disabled_rules: set[str] | None = None,
     mypy_cmd: list[str] | None = None,
     ruff_cmd: list[str] | None = None,
+    use_cache: bool = True,
 ) -> list[LintIssue]:
     """Lint a Python file for PyTango issues."""
     try:
-        content = filepath.read_text()
-        tree = ast.parse(content, filename=str(filepath))
-
+        # ast.parse takes the raw bytes (honouring any PEP 263 coding line)
+        # and the cache hashes them directly; the text is decoded only once,
+        # for the source rules and noqa handling.
+        data = filepath.read_bytes()
         disabled = disabled_rules or set()
-
-        linter = TangoLinter(str(filepath), disabled_rules=disabled)
-        linter.visit(tree)
-
-        if not linter.has_tango_import: #This ain't be tango
+        use_cache = use_cache and cache_dir() is not None
+
+        # Finished results are cached too, keyed by the file contents and
+        # the rule set, so an unchanged file skips parsing and every rule.
+        key = results_file = ast_file = None
+        if use_cache:
+            key = hashlib.sha256(data).hexdigest()
+            fingerprint = _rules_fingerprint(
+                frozenset(disabled), rules.get_ast_rules(), rules.get_source_rules()
+            )
+            results_file = cache_dir() / f"{key}-{fingerprint[:16]}.lint"
+            cached = _cache_load(results_file)
+            if cached is not None:
+                return [LintIssue(*raw) for raw in cached]
+            ast_file = _ast_cache_file(key)
+
+        tree, tree_cached = _parse_cached(filepath, data, ast_file)
+        encoding, _ = tokenize.detect_encoding(io.BytesIO(data).readline)
+        content = data.decode(encoding, errors="replace")
+
+        # Not cached: mypy and ruff results depend on their own config.
+        if not _imports_tango(tree): #This ain't be tango
+            # So keep the AST instead; a Tango file's results are cached,
+            # and its AST would only be read again if the rules changed.
+            if ast_file is not None and not tree_cached:
+                _cache_store(ast_file, tree)
             diagnostics = []
             if mypy_cmd:
                 mypy_issues = run_mypy(mypy_cmd, filepath)
@@ -294,36 +632,31 @@ def lint_file(
                 diagnostics += ruff_issues
             return diagnostics
 
-        source_issues: list[LintIssue] = []
+        linter = TangoLinter(str(filepath), disabled_rules=disabled)
+        linter.visit(tree)
+
+        src = rules.SourceContext(content)
+        source_issues: list[RawIssue] = []
         for rule in rules.get_source_rules():
             if rule.code in disabled:
                 continue
-            for line, column, message in rule.check_source(content):
+            for line, column, message in rule.check(src):
                 source_issues.append(
-                    LintIssue(
-                        line=line,
-                        column=column,
-                        severity=rule.severity,
-                        code=rule.code,
-                        message=message,
-                    )
+                    (line, column, rule.severity, rule.code, message)
                 )
 
-        all_issues = sorted(
-            linter.issues + source_issues, key=lambda x: (x.line, x.column)
+        # Both lists come out (nearly) in line order, so sorting each one is
+        # cheap and a stable merge avoids re-sorting the concatenation.
+        all_issues = heapq.merge(
+            sorted(linter.raw_issues, key=_issue_key),
+            sorted(source_issues, key=_issue_key),
+            key=_issue_key,
         )
 
-        # Filter noqa annotations.
-        noqa = _parse_noqa(content)
-        def _suppressed(issue: LintIssue) -> bool:
-            suppression = noqa.get(issue.line)
-            if suppression is None and issue.line in noqa:
-                return True   # bare # noqa
-            if isinstance(suppression, set) and issue.code in suppression:
-                return True
-            return False
-
-        return [i for i in all_issues if not _suppressed(i)]
+        raw_issues = list(_filter_noqa(all_issues, src))
+        if results_file is not None:
+            _cache_store(results_file, raw_issues)
+        return [LintIssue(*raw) for raw in raw_issues]
 
     except SyntaxError as e:
         return [
@@ -347,7 +680,55 @@ def lint_file(
         ]
 
 
-def format_issue(issue: LintIssue, filename: str) -> str:
+def _lint_one(
+    filepath: Path, disabled_rules: set[str] | None = None,
+    mypy_cmd: list[str] | None = None,
+    ruff_cmd: list[str] | None = None,
+    use_cache: bool = True,
+) -> tuple[Path, list[LintIssue]]:
+    """Top-level (picklable) wrapper around `lint_file` for worker processes."""
+    return filepath, lint_file(
+        filepath, disabled_rules=disabled_rules, mypy_cmd=mypy_cmd,
+        ruff_cmd=ruff_cmd, use_cache=use_cache,
+    )
+
+
+def _init_worker(disabled_rules: set[str] | None) -> None:
+    """Build the rule dispatch tables once per worker, before any file."""
+    _build_rule_maps(frozenset(disabled_rules or ()), rules.get_ast_rules())
+
+
+def lint_files(
+    filepaths: list[Path], jobs: int | None = None, **kwargs
+) -> Iterator[tuple[Path, list[LintIssue]]]:
+    """Lint several files, in parallel when *jobs* allows, in input order."""
+    worker = functools.partial(_lint_one, **kwargs)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(filepaths) < 2:
+        yield from map(worker, filepaths)
+        return
+    jobs = min(jobs, len(filepaths))
+    chunksize = max(1, len(filepaths) // (4 * jobs))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(kwargs.get("disabled_rules"),),
+    ) as executor:
+        yield from executor.map(worker, filepaths, chunksize=chunksize)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for ``--jobs``: an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return number
+
+
+def format_issue(issue: LintIssue, filename: str, use_color: bool = True) -> str:
     """Pretty."""
     
     severity_colors = {
@@ -355,8 +736,11 @@ def format_issue(issue: LintIssue, filename: str) -> str:
         "warning": "\033[93m",  # Yellow
         "info": "\033[94m",  # Blue
     }
-    reset = "\033[0m"
-    color = severity_colors.get(issue.severity, "")
+    if use_color:
+        reset = "\033[0m"
+        color = severity_colors.get(issue.severity, "")
+    else:
+        reset = color = ""
 
     return (
         f"{filename}:{issue.line}:{issue.column}: "
@@ -368,18 +752,6 @@ def print_summary(
     issues: list[LintIssue], filename: str, use_color: bool = True
 ) -> None:
     """Print a formatted summary of linting issues."""
-    if not use_color:
-        # Strip color codes for non-terminal output
-        global format_issue
-        original_format = format_issue
-
-        def no_color_format(issue: LintIssue, fn: str) -> str:
-            return original_format(issue, fn).replace("\033[91m", "").replace(
-                "\033[93m", ""
-            ).replace("\033[94m", "").replace("\033[0m", "")
-
-        format_issue = no_color_format
-
     if not issues:
         print(f"✓ {filename}: No issues found")
         return
@@ -393,7 +765,7 @@ def print_summary(
     infos = [i for i in issues if i.severity == "info"]
 
     for issue in issues:
-        print(format_issue(issue, filename))
+        print(format_issue(issue, filename, use_color=use_color))
 
     print(f"\n{'-'*80}")
     print(
@@ -464,6 +836,24 @@ def main() -> int:
         help="Disable a rule by code (e.g. --disable T001 --disable G007). "
              "May be repeated.",
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=_positive_int,
+        metavar="N",
+        default=None,
+        help="Number of files to lint in parallel (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached ASTs and results in "
+             f"{cache_dir() or 'the cache directory'}",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Empty the cache directory before linting",
+    )
     parser.add_argument(
         "--list-rules",
         action="store_true",
@@ -474,7 +864,7 @@ def main() -> int:
 
     if args.list_rules:
         all_rules: list[tuple[str, str, str]] = []
-        for rule in rules.get_ast_rules() + rules.get_source_rules():  # type: ignore[operator]
+        for rule in (*rules.get_ast_rules(), *rules.get_source_rules()):
             all_rules.append((rule.code, rule.severity, rule.__doc__ or ""))
         all_rules.sort()
         col = max(len(r[0]) for r in all_rules) + 2
@@ -483,6 +873,12 @@ def main() -> int:
             print(f"{code:<{col}} [{severity:<7}]  {desc}")
         return 0
 
+    if args.clear_cache:
+        removed = clear_cache()
+        print(f"Removed {removed} cached file(s) from {cache_dir()}")
+        if not args.files:
+            return 0
+
     if not args.files:
         parser.print_help()
         return 0
@@ -492,22 +888,31 @@ def main() -> int:
     total_warnings = 0
     total_infos = 0
 
-    for filepath in args.files:
-        if not filepath.exists():
-            print(f"Error: File '{filepath}' not found", file=sys.stderr)
-            return 1
-
+    # As when files were linted one by one: everything before the first
+    # missing file is reported, in order, and then linting stops.
+    missing = next((f for f in args.files if not f.exists()), None)
+    planned = args.files[: args.files.index(missing)] if missing else args.files
+    results = lint_files(
+        [f for f in planned if f.suffix == ".py"], jobs=args.jobs,
+        disabled_rules=disabled, mypy_cmd=mypy_cmd, ruff_cmd=ruff_cmd,
+        use_cache=not args.no_cache,
+    )
+    for filepath in planned:
         if not filepath.suffix == ".py":
             print(f"Warning: Skipping non-Python file '{filepath}'")
             continue
 
-        issues = lint_file(filepath, disabled_rules=disabled, mypy_cmd=mypy_cmd, ruff_cmd=ruff_cmd)
+        _, issues = next(results)
         print_summary(issues, str(filepath), use_color=not args.no_color)
 
         total_errors += sum(1 for i in issues if i.severity == "error")
         total_warnings += sum(1 for i in issues if i.severity == "warning")
         total_infos += sum(1 for i in issues if i.severity == "info")
 
+    if missing is not None:
+        print(f"Error: File '{missing}' not found", file=sys.stderr)
+        return 1
+
     if len(args.files) > 1:
         print(f"\n{'='*80}")
         print(
@@ -10,13 +10,26 @@ Rule attributes:
     severity = "warning"    # 'error', 'warning', or 'info'
     handles  = (ast.Xyz,)   # AST node type(s) that trigger check()
                             # (ASTRule only; omit for SourceRule)
+    requires_device_class = True
+                            # ASTRule only: skip the rule entirely outside
+                            # Tango device classes. Defaults to True for
+                            # T-codes and False otherwise.
+    requires_tango_attribute = True
+                            # ASTRule only: run on a FunctionDef only when
+                            # it is decorated with @attribute.
 
 For ASTRule, you need to mplement the check method: 
 
        # ASTRule:
        def check(self, node, ctx):
            if <condition>:
-               yield node, "human-readable message"
+               return [(node, "human-readable message")]
+
+It returns a list of violations, or ``None`` (or an empty list) when there
+are none, which is the common case and avoids creating a generator for
+every node. The built-in rules all return lists, including those that
+report several violations; a generator yielding ``node, "message"``
+pairs is still accepted.
 
 for SourceRuke, check_source:
        # SourceRule:
@@ -24,141 +37,454 @@ for SourceRuke, check_source:
            if <condition>:
                yield line_number, column, "human-readable message"
 
-both required a `yield` for each violation
+check_source yields one tuple per violation. Line-based rules can instead
+override check(src), where ``src.lines`` is split once and shared.
+
+Rules are instantiated once and keep no per-instance state, so each class
+declares ``__slots__ = ()``.
 
 """
 
 from __future__ import annotations
 
 import ast
+import sys
+from collections.abc import Mapping as MappingABC
 from dataclasses import dataclass, field
-from typing import Any, Iterator
-
-_AST_RULES: list[ASTRule] = []
-_SOURCE_RULES: list[SourceRule] = []
-
-@dataclass
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping
+
+# Registries are tuples, rebuilt on (import-time) registration, so the
+# getters can hand out the same immutable snapshot on every call.
+_AST_RULES: tuple[ASTRule, ...] = ()
+_SOURCE_RULES: tuple[SourceRule, ...] = ()
+#: AST rules indexed by the node types they handle, in registration order.
+#: Rules handling ``FunctionDef`` are also filed under ``AsyncFunctionDef``.
+_AST_RULES_BY_TYPE: dict[type[ast.AST], tuple[ASTRule, ...]] = {}
+# Node classes bound once at module level: the helpers and rules test these
+# on every node they see, and a global beats an ``ast.<Name>`` lookup.
+_Attribute, _Call, _Name = ast.Attribute, ast.Call, ast.Name
+_Constant = ast.Constant
+_Func = (ast.FunctionDef, ast.AsyncFunctionDef)
+_Mutable = (ast.List, ast.Dict, ast.Set)
+
+#: Call names treated as a blocking sleep (T046).
+_SLEEP_NAMES = frozenset({"sleep", "time.sleep"})
+
+#: Shared read-only empty mapping: the kwargs of a call without any, so it
+#: does not allocate a dict it never fills.
+EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True, eq=False)
+class AttributeConfig(MappingABC):
+    """Keyword arguments of an ``@attribute(...)`` decorator.
+
+    A read-only mapping over ``raw`` (every constant keyword), with the keys
+    the built-in rules ask about resolved once when the decorator is read.
+    """
+
+    raw: Mapping[str, Any] = field(default_factory=lambda: EMPTY_CONFIG)
+    name: Any = None
+    has_description: bool = False
+    has_unit: bool = False
+    has_label: bool = False
+
+    @classmethod
+    def from_kwargs(cls, kwargs: Mapping[str, Any]) -> AttributeConfig:
+        if not kwargs:
+            return NO_ATTRIBUTE_CONFIG
+        return cls(
+            kwargs,
+            kwargs.get("name"),
+            "description" in kwargs,
+            "unit" in kwargs,
+            "label" in kwargs,
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        return self.raw[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.raw
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.raw.get(key, default)
+
+
+#: The ``attribute_config`` of everything that is not a configured
+#: ``@attribute``.
+NO_ATTRIBUTE_CONFIG = AttributeConfig()
+
+
+@dataclass(slots=True)
 class RuleContext:
-    """State context."""
+    """State context.
+
+    The linter reuses a single instance for a whole file, so rules must not
+    hold on to it between calls.
+    """
 
     in_device_class: bool = False
     current_class: str | None = None
     is_tango_attribute: bool = False
     is_tango_command: bool = False
-    attribute_config: dict[str, Any] = field(default_factory=dict)
+    #: Constant keyword arguments of the ``@attribute(...)`` decorator; a
+    #: plain mapping passed in is converted to an `AttributeConfig`.
+    attribute_config: AttributeConfig = field(
+        default_factory=lambda: NO_ATTRIBUTE_CONFIG
+    )
+    #: Names of the methods defined directly in the device class being
+    #: entered; set by the linter before the ClassDef rules run.
+    method_names: frozenset[str] = frozenset()
+    #: `get_name` results for the file being linted, keyed by ``id(node)``.
+    name_cache: dict[int, str] = field(default_factory=dict)
+    #: Lazily built `FunctionSummary` per FunctionDef, keyed by ``id(node)``.
+    function_summaries: dict[int, FunctionSummary] = field(default_factory=dict)
+    #: ``ast.get_docstring`` results per node, keyed by ``id(node)``.
+    docstrings: dict[int, str | None] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.attribute_config, AttributeConfig):
+            self.attribute_config = AttributeConfig.from_kwargs(
+                self.attribute_config
+            )
+
+
+@dataclass(slots=True)
+class FunctionSummary:
+    """Facts about a function body, gathered in a single ``ast.walk``.
+
+    Several rules need to look inside a function body (for sleep, thread,
+    print or super() calls); they share one summary instead of each
+    walking the subtree again.
+    """
+
+    #: Dotted names of every call in the body.
+    call_names: set[str] = field(default_factory=set)
+    #: Methods called as ``super().<method>()``.
+    super_calls: set[str] = field(default_factory=set)
+    #: First ``sleep()`` / ``time.sleep()`` call, in walk order.
+    sleep_call: ast.Call | None = None
+    #: First ``threading.Thread`` / ``Thread`` call, in walk order.
+    thread_call: ast.Call | None = None
+    #: All bare ``print()`` calls, in walk order.
+    print_calls: list[ast.Call] = field(default_factory=list)
+
+    def calls(self, func_name: str) -> bool:
+        """Like `has_call_to`, answered from the collected call names."""
+        return func_name in self.call_names or any(
+            func_name in name for name in self.call_names
+        )
 
 class ASTRule:
     """AST nodes rules."""
 
+    # Rules are stateless singletons; all their settings are class-level.
+    __slots__ = ()
     code: str = ""
     severity: str = "warning"
     #: AST node types that trigger ``check``.
     handles: tuple[type[ast.AST], ...] = ()
+    #: Only run inside a Tango device class. ``None`` infers it from the code
+    #: (T-codes are device-only); see ``device_class_only``.
+    requires_device_class: bool | None = None
+    #: Only run on functions decorated with ``@attribute``; the linter keeps
+    #: these rules in a separate table, so plain methods never call them.
+    requires_tango_attribute: bool = False
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
+        global _AST_RULES
         super().__init_subclass__(**kwargs)
         if cls.code and not any(r.code == cls.code for r in _AST_RULES):
-            _AST_RULES.append(cls())
+            rule = cls()
+            _AST_RULES += (rule,)
+            node_types = dict.fromkeys(cls.handles)
+            # Async functions share the same rules as regular functions.
+            if ast.FunctionDef in node_types:
+                node_types.setdefault(ast.AsyncFunctionDef)
+            for node_type in node_types:
+                _AST_RULES_BY_TYPE[node_type] = (
+                    _AST_RULES_BY_TYPE.get(node_type, ()) + (rule,)
+                )
+
+    @property
+    def device_class_only(self) -> bool:
+        """Whether this rule can only fire inside a Tango device class."""
+        if self.requires_device_class is None:
+            return self.code.startswith("T")
+        return self.requires_device_class
 
     def check(
         self, node: ast.AST, ctx: RuleContext
-    ) -> Iterator[tuple[ast.AST, str]]:
-        """Yield ``(node, message)`` for each violation found."""
-        return
-        yield  # pragma: no cover — makes this a generator
+    ) -> Iterable[tuple[ast.AST, str]] | None:
+        """Return the ``(node, message)`` violations found, or ``None``.
+
+        Rules that can report several violations may instead be written as
+        generators yielding ``(node, message)``.
+        """
+        return None
 
 
 class SourceRule:
     """Source code rules """
 
+    __slots__ = ()
     code: str = ""
     severity: str = "info"
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
+        global _SOURCE_RULES
         super().__init_subclass__(**kwargs)
         if cls.code and not any(r.code == cls.code for r in _SOURCE_RULES):
-            _SOURCE_RULES.append(cls())
+            _SOURCE_RULES += (cls(),)
+
+    def check(self, src: SourceContext) -> Iterable[tuple[int, int, str]]:
+        """Return the ``(line, column, message)`` violations in *src*.
+
+        Defaults to `check_source` on the raw text; rules that work line by
+        line override this to share ``src.lines``.
+        """
+        return self.check_source(src.source)
 
     def check_source(self, source: str) -> Iterator[tuple[int, int, str]]:
         """Yield ``(line, column, message)`` for each violation found."""
         return
         yield  # pragma: no cover
 
+
+@dataclass(slots=True)
+class SourceContext:
+    """Text of the file being linted, shared by the source rules.
+
+    ``lines`` is split on first use and then reused by every rule and by
+    the linter's noqa handling, rather than each splitting the source.
+    """
+
+    source: str
+    _lines: list[str] | None = field(default=None, init=False, repr=False)
+
+    @property
+    def lines(self) -> list[str]:
+        """The source split with ``str.splitlines``."""
+        if self._lines is None:
+            self._lines = self.source.splitlines()
+        return self._lines
+
 # Helpers
 
-def get_name(node: ast.expr) -> str:
-    """Return the dotted name of a Name, Attribute, or Call node."""
-    if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        return f"{get_name(node.value)}.{node.attr}"
-    if isinstance(node, ast.Call):
-        return get_name(node.func)
-    return ""
+def get_name(node: ast.expr, cache: dict[int, str] | None = None) -> str:
+    """Return the dotted name of a Name, Attribute, or Call node.
+
+    Pass *cache* (usually ``ctx.name_cache``) to memoise the result by node
+    identity; it must only ever hold nodes of one live tree.
+    """
+    if cache is None:
+        return _dotted_name(node)
+    name = cache.get(id(node))
+    if name is None:
+        name = cache[id(node)] = _dotted_name(node)
+    return name
+
+
+def _dotted_name(node: ast.expr) -> str:
+    """Uncached implementation of `get_name`."""
+    # Parsed trees only contain the exact node classes, so dispatch on
+    # ``type(node) is`` rather than the slower isinstance() checks.
+    kind = type(node)
+    if kind is _Name:
+        return node.id  # type: ignore[attr-defined]
+    # Collect segments right-to-left and join once, rather than recursing
+    # and re-formatting the prefix for every segment of a dotted chain.
+    parts: list[str] = []
+    while True:
+        if kind is _Attribute:
+            parts.append(node.attr)  # type: ignore[attr-defined]
+            node = node.value  # type: ignore[attr-defined]
+        elif kind is _Call:
+            node = node.func  # type: ignore[attr-defined]
+        elif kind is _Name:
+            parts.append(node.id)  # type: ignore[attr-defined]
+            break
+        else:
+            parts.append("")  # e.g. x[0].attr -> ".attr", as before
+            break
+        kind = type(node)
+    parts.reverse()
+    # Interned so the many repeats of e.g. "self.info_stream" held in name
+    # caches and call-name sets share one string.
+    return sys.intern(".".join(parts))
 
 
 def get_constant_value(node: ast.expr) -> Any:
     """Return the value of an ``ast.Constant`` node, or ``None``."""
-    return node.value if isinstance(node, ast.Constant) else None
+    return node.value if isinstance(node, _Constant) else None
+
+
+def get_call_kwargs(call: ast.Call) -> Mapping[str, Any]:
+    """Return the constant keyword arguments of *call* as a mapping."""
+    if not call.keywords:
+        return EMPTY_CONFIG
+    return {
+        keyword.arg: get_constant_value(keyword.value)
+        for keyword in call.keywords
+        if keyword.arg
+    }
+
+
+def decorator_kind(
+    decorator: ast.expr, name_cache: dict[int, str] | None = None
+) -> str:
+    """Return the last dotted segment of *decorator*'s name.
+
+    ``@attribute``, ``@server.attribute(...)`` and ``@ts.attribute`` (with
+    ``import tango.server as ts``) all give ``"attribute"``, while a helper
+    such as ``@my_attribute_helper`` does not.
+    """
+    return get_name(decorator, name_cache).rpartition(".")[2]
 
 
 def get_decorator_info(
-    decorator: ast.expr,
-) -> tuple[str, dict[str, Any]] | None:
-    """Return ``(name, kwargs_dict)`` for a decorator, or ``None``."""
-    kwargs: dict[str, Any] = {}
-    if isinstance(decorator, ast.Call):
-        for keyword in decorator.keywords:
-            if keyword.arg:
-                kwargs[keyword.arg] = get_constant_value(keyword.value)
-        return get_name(decorator.func), kwargs
-    if isinstance(decorator, (ast.Name, ast.Attribute)):
-        return get_name(decorator), {}
+    decorator: ast.expr, name_cache: dict[int, str] | None = None
+) -> tuple[str, Mapping[str, Any]] | None:
+    """Return ``(name, kwargs)`` for a decorator, or ``None``.
+
+    Decorators without keyword arguments share the read-only `EMPTY_CONFIG`.
+    """
+    if isinstance(decorator, _Call):
+        return get_name(decorator, name_cache), get_call_kwargs(decorator)
+    if isinstance(decorator, (_Name, _Attribute)):
+        return get_name(decorator, name_cache), EMPTY_CONFIG
     return None
 
 
-def has_call_to(node: ast.AST, func_name: str) -> bool:
+def has_call_to(
+    node: ast.AST, func_name: str, name_cache: dict[int, str] | None = None
+) -> bool:
     """Return ``True`` if *node* or any descendant calls *func_name*."""
-    return any(
-        isinstance(child, ast.Call) and func_name in get_name(child.func)
-        for child in ast.walk(node)
-    )
+    # Depth-first over a plain list, reading children straight from
+    # ``_fields``, and stopping at the first match.
+    AST = ast.AST
+    stack = [node]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        child = pop()
+        if type(child) is _Call and func_name in get_name(
+            child.func, name_cache  # type: ignore[attr-defined]
+        ):
+            return True
+        for field in child._fields:
+            value = getattr(child, field, None)
+            if isinstance(value, AST):
+                push(value)
+            elif isinstance(value, list):
+                extend([v for v in value if isinstance(v, AST)])
+    return False
 
-def get_ast_rules() -> list[ASTRule]:
+def get_ast_rules() -> tuple[ASTRule, ...]:
     """Return all registered AST rules."""
-    return list(_AST_RULES)
+    return _AST_RULES
 
 
-def get_source_rules() -> list[SourceRule]:
-    """Return all registered source-text rules."""
-    return list(_SOURCE_RULES)
+def get_ast_rules_by_type() -> Mapping[type[ast.AST], tuple[ASTRule, ...]]:
+    """Return a read-only view of the node type -> AST rules index.
 
-def _calls_super_method(func_node: ast.FunctionDef, method: str) -> bool:
-    """Return True if *func_node* contains a super().<method>() call."""
-    for child in ast.walk(func_node):
-        if (
-            isinstance(child, ast.Call)
-            and isinstance(child.func, ast.Attribute)
-            and child.func.attr == method
-            and isinstance(child.func.value, ast.Call)
-            and isinstance(child.func.value.func, ast.Name)
-            and child.func.value.func.id == 'super'
+    Rules for each type are in registration order; use ``.get(node_type,
+    ())`` to look up a single type.
+    """
+    return MappingProxyType(_AST_RULES_BY_TYPE)
+
+
+def get_source_rules() -> tuple[SourceRule, ...]:
+    """Return all registered source-text rules."""
+    return _SOURCE_RULES
+
+def summarize_function(
+    func_node: ast.AST, name_cache: dict[int, str] | None = None
+) -> FunctionSummary:
+    """Walk *func_node* once and collect the facts the function rules need."""
+    summary = FunctionSummary()
+    AST = ast.AST
+    # Breadth-first, in the same order as ast.walk (so "first" sleep/thread
+    # call keeps its meaning), but by iterating a list that grows as the
+    # children are queued rather than through generators.
+    queue: list[ast.AST] = [func_node]
+    append, extend = queue.append, queue.extend
+    for child in queue:
+        for field in child._fields:
+            value = getattr(child, field, None)
+            if isinstance(value, AST):
+                append(value)
+            elif isinstance(value, list):
+                extend([v for v in value if isinstance(v, AST)])
+        if type(child) is not _Call:
+            continue
+        func = child.func
+        name = get_name(func, name_cache)
+        summary.call_names.add(name)
+        if name in _SLEEP_NAMES:
+            if summary.sleep_call is None:
+                summary.sleep_call = child
+        elif 'Thread' in name and ('threading' in name or name == 'Thread'):
+            if summary.thread_call is None:
+                summary.thread_call = child
+        elif isinstance(func, _Name) and func.id == "print":
+            summary.print_calls.append(child)
+        elif (
+            isinstance(func, _Attribute)
+            and isinstance(func.value, _Call)
+            and isinstance(func.value.func, _Name)
+            and func.value.func.id == 'super'
         ):
-            return True
-    return False
+            summary.super_calls.add(func.attr)
+    return summary
+
+
+def _function_summary(node: ast.AST, ctx: RuleContext) -> FunctionSummary:
+    """Return the summary of *node*, building it on first use.
+
+    The first rule that needs it pays for the walk; the others read the
+    cached result from ``ctx.function_summaries``.
+    """
+    summary = ctx.function_summaries.get(id(node))
+    if summary is None:
+        summary = summarize_function(node, ctx.name_cache)
+        ctx.function_summaries[id(node)] = summary
+    return summary
+
+
+#: Cache-miss marker for lookups whose cached value may be ``None``.
+_MISSING: Any = object()
+
+
+def _docstring(node: ast.AST, ctx: RuleContext) -> str | None:
+    """Return ``ast.get_docstring(node)``, cached in ``ctx.docstrings``."""
+    docstring = ctx.docstrings.get(id(node), _MISSING)
+    if docstring is _MISSING:
+        docstring = ast.get_docstring(node)  # type: ignore[arg-type]
+        ctx.docstrings[id(node)] = docstring
+    return docstring
 
 
 def _has_read_write_access(decorator: ast.expr) -> bool:
     """Return True if the decorator includes access=...READ_WRITE..."""
-    if not isinstance(decorator, ast.Call):
+    if not isinstance(decorator, _Call):
         return False
     for kw in decorator.keywords:
         if kw.arg == 'access':
+            # A keyword can only be given once, so this one decides.
             val = kw.value
-            if isinstance(val, ast.Attribute) and 'READ_WRITE' in val.attr:
-                return True
-            if isinstance(val, ast.Name) and 'READ_WRITE' in val.id:
-                return True
+            if isinstance(val, _Attribute):
+                return 'READ_WRITE' in val.attr
+            if isinstance(val, _Name):
+                return 'READ_WRITE' in val.id
+            return False
     return False
 
 # # # # # # # # # # # # # # # # # # # # # # # # # # # 
@@ -170,119 +496,144 @@ def _has_read_write_access(decorator: ast.expr) -> bool:
 class T001_DeviceClassNaming(ASTRule):
     """Device class name should start with an uppercase letter."""
 
+    __slots__ = ()
     code = "T001"
     severity = "warning"
     handles = (ast.ClassDef,)
 
     def check(self, node: ast.ClassDef, ctx: RuleContext):  # type: ignore[override]
         if ctx.in_device_class and not node.name[0].isupper():
-            yield node, f"Device class '{node.name}' should start with uppercase letter"
+            return [(
+                node,
+                f"Device class '{node.name}' should start with uppercase letter",
+            )]
 
 class T010_PropertyMissingAnnotation(ASTRule):
     """device_property must have a type annotation."""
 
+    __slots__ = ()
     code = "T010"
     severity = "error"
     handles = (ast.AnnAssign,)
 
     def check(self, node: ast.AnnAssign, ctx: RuleContext):  # type: ignore[override]
-        if not ctx.in_device_class or not isinstance(node.target, ast.Name):
+        if not ctx.in_device_class or not isinstance(node.target, _Name):
             return
         if (
-            isinstance(node.value, ast.Call)
-            and "device_property" in get_name(node.value.func)
+            isinstance(node.value, _Call)
+            and "device_property" in get_name(node.value.func, ctx.name_cache)
             and node.annotation is None
         ):
-            yield node, f"Device property '{node.target.id}' must have type annotation"
+            return [(
+                node,
+                f"Device property '{node.target.id}' must have type annotation",
+            )]
 
 class T011_PropertyNaming(ASTRule):
     """device_property name should use PascalCase."""
 
+    __slots__ = ()
     code = "T011"
     severity = "warning"
     handles = (ast.AnnAssign,)
 
     def check(self, node: ast.AnnAssign, ctx: RuleContext):  # type: ignore[override]
-        if not ctx.in_device_class or not isinstance(node.target, ast.Name):
+        if not ctx.in_device_class or not isinstance(node.target, _Name):
             return
         if (
-            isinstance(node.value, ast.Call)
-            and "device_property" in get_name(node.value.func)
+            isinstance(node.value, _Call)
+            and "device_property" in get_name(node.value.func, ctx.name_cache)
             and not node.target.id[0].isupper()
         ):
-            yield node, f"Device property '{node.target.id}' should use PascalCase"
+            return [(node, f"Device property '{node.target.id}' should use PascalCase")]
 
 
 class T020_AttributeMissingDocstring(ASTRule):
     """Tango @attribute method should have a docstring."""
 
+    __slots__ = ()
     code = "T020"
     severity = "warning"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
-        if ctx.is_tango_attribute and not ast.get_docstring(node):
-            yield node, f"Attribute '{node.name}' should have a docstring"
+        if ctx.is_tango_attribute and not _docstring(node, ctx):
+            return [(node, f"Attribute '{node.name}' should have a docstring")]
 
 class T021_AttributeMissingReturnType(ASTRule):
     """Tango @attribute method must have a return-type annotation."""
 
+    __slots__ = ()
     code = "T021"
     severity = "error"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if ctx.is_tango_attribute and node.returns is None:
-            yield node, f"Attribute '{node.name}' must have return type annotation"
+            return [(node, f"Attribute '{node.name}' must have return type annotation")]
 
 class T022_AttributeNameMismatch(ASTRule):
     """Attribute 'name' config key differs from the method name."""
 
+    __slots__ = ()
     code = "T022"
     severity = "info"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.is_tango_attribute:
             return
-        configured_name = ctx.attribute_config.get("name")
+        configured_name = ctx.attribute_config.name
         if configured_name and configured_name != node.name:
-            yield node, (
-                f"Attribute name '{configured_name}' differs from method name '{node.name}'"
-            )
+            return [(
+                node,
+                f"Attribute name '{configured_name}' differs from method name '{node.name}'",
+            )]
 
 class T023_AttributeMissingDescription(ASTRule):
     """Tango @attribute should include a 'description' parameter."""
 
+    __slots__ = ()
     code = "T023"
     severity = "warning"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
-        if ctx.is_tango_attribute and "description" not in ctx.attribute_config:
-            yield node, f"Attribute '{node.name}' should have 'description' parameter"
+        if ctx.is_tango_attribute and not ctx.attribute_config.has_description:
+            return [(
+                node,
+                f"Attribute '{node.name}' should have 'description' parameter",
+            )]
 
 class T024_AttributeMissingUnit(ASTRule):
     """Tango @attribute may need a 'unit' parameter."""
 
+    __slots__ = ()
     code = "T024"
     severity = "info"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if (
             ctx.is_tango_attribute
-            and "unit" not in ctx.attribute_config
+            and not ctx.attribute_config.has_unit
             and not node.name.endswith("Status")
         ):
-            yield node, f"Attribute '{node.name}' may need 'unit' parameter"
+            return [(node, f"Attribute '{node.name}' may need 'unit' parameter")]
 
 class T025_AttributeMissingQualityCheck(ASTRule):
     """Tango @attribute body may need quality validation via set_validity."""
 
+    __slots__ = ()
     code = "T025"
     severity = "info"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.is_tango_attribute:
@@ -293,43 +644,51 @@ class T025_AttributeMissingQualityCheck(ASTRule):
         if (
             body
             and isinstance(body[0], ast.Expr)
-            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value, _Constant)
         ):
             body = body[1:]
-        if not has_call_to(node, "set_validity") and len(body) > 1:
-            yield node, f"Attribute '{node.name}' may need quality validation"
+        if len(body) <= 1:
+            return
+        if not _function_summary(node, ctx).calls("set_validity"):
+            return [(node, f"Attribute '{node.name}' may need quality validation")]
 
 class T030_CommandMissingDocstring(ASTRule):
     """Tango @command method should have a docstring."""
 
+    __slots__ = ()
     code = "T030"
     severity = "warning"
     handles = (ast.FunctionDef,)
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
-        if ctx.is_tango_command and not ast.get_docstring(node):
-            yield node, f"Command '{node.name}' should have a docstring"
+        if ctx.is_tango_command and not _docstring(node, ctx):
+            return [(node, f"Command '{node.name}' should have a docstring")]
 
 class T031_CommandNaming(ASTRule):
     """Tango @command name should use PascalCase."""
 
+    __slots__ = ()
     code = "T031"
     severity = "info"
     handles = (ast.FunctionDef,)
 
-    _COMMON = {"Init", "On", "Off", "State", "Status", "Standby", "Reset"}
+    #: Standard Tango command names accepted as-is.
+    _COMMON: frozenset[str] = frozenset(
+        {"Init", "On", "Off", "State", "Status", "Standby", "Reset"}
+    )
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if (
             ctx.is_tango_command
-            and node.name not in self._COMMON
             and not node.name[0].isupper()
+            and node.name not in self._COMMON
         ):
-            yield node, f"Command '{node.name}' should use PascalCase"
+            return [(node, f"Command '{node.name}' should use PascalCase")]
 
 class T032_DoNotOverrideInit(ASTRule):
     """Tango device classes must not override __init__; use init_device() instead."""
 
+    __slots__ = ()
     code = "T032"
     severity = "error"
     handles = (ast.FunctionDef,)
@@ -339,14 +698,16 @@ class T032_DoNotOverrideInit(ASTRule):
             return
 
         if node.name == "__init__":
-            yield node, (
+            return [(
+                node,
                 f"Device class '{ctx.current_class}' must not override '__init__'; "
-                "override 'init_device()' instead"
-            )
+                "override 'init_device()' instead",
+            )]
 
 class T033_InitDeviceMissingSuper(ASTRule):
     """init_device() should call super().init_device() to ensure proper initialisation."""
 
+    __slots__ = ()
     code = "T033"
     severity = "warning"
     handles = (ast.FunctionDef,)
@@ -354,12 +715,13 @@ class T033_InitDeviceMissingSuper(ASTRule):
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class or node.name != 'init_device':
             return
-        if not _calls_super_method(node, 'init_device'):
-            yield node, "init_device() should call super().init_device()"
+        if 'init_device' not in _function_summary(node, ctx).super_calls:
+            return [(node, "init_device() should call super().init_device()")]
 
 class T034_DeleteDeviceMissingSuper(ASTRule):
     """delete_device() should call super().delete_device() to release base-class resources."""
 
+    __slots__ = ()
     code = "T034"
     severity = "warning"
     handles = (ast.FunctionDef,)
@@ -367,12 +729,13 @@ class T034_DeleteDeviceMissingSuper(ASTRule):
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class or node.name != 'delete_device':
             return
-        if not _calls_super_method(node, 'delete_device'):
-            yield node, "delete_device() should call super().delete_device()"
+        if 'delete_device' not in _function_summary(node, ctx).super_calls:
+            return [(node, "delete_device() should call super().delete_device()")]
 
 class T035_AlwaysHookMissingSuper(ASTRule):
     """always_executed_hook() should call super().always_executed_hook()."""
 
+    __slots__ = ()
     code = "T035"
     severity = "warning"
     handles = (ast.FunctionDef,)
@@ -380,45 +743,61 @@ class T035_AlwaysHookMissingSuper(ASTRule):
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class or node.name != 'always_executed_hook':
             return
-        if not _calls_super_method(node, 'always_executed_hook'):
-            yield node, "always_executed_hook() should call super().always_executed_hook()"
+        if 'always_executed_hook' not in _function_summary(node, ctx).super_calls:
+            return [(
+                node,
+                "always_executed_hook() should call super().always_executed_hook()",
+            )]
 
 class T040_PropertyMissingDefault(ASTRule):
     """device_property should have a default_value to avoid failures when unconfigured."""
 
+    __slots__ = ()
     code = "T040"
     severity = "warning"
     handles = (ast.AnnAssign,)
 
     def check(self, node: ast.AnnAssign, ctx: RuleContext):  # type: ignore[override]
-        if not ctx.in_device_class or not isinstance(node.target, ast.Name):
+        if not ctx.in_device_class or not isinstance(node.target, _Name):
             return
-        if not (isinstance(node.value, ast.Call) and "device_property" in get_name(node.value.func)):
+        if not (
+            isinstance(node.value, _Call)
+            and "device_property" in get_name(node.value.func, ctx.name_cache)
+        ):
             return
         if not any(kw.arg == 'default_value' for kw in node.value.keywords):
-            yield node, (
+            return [(
+                node,
                 f"Device property '{node.target.id}' should have a 'default_value' "
-                "to avoid failures when the property is unconfigured"
-            )
+                "to avoid failures when the property is unconfigured",
+            )]
 
 class T041_PropertyMissingDoc(ASTRule):
     """device_property should have a 'doc' parameter describing its purpose."""
 
+    __slots__ = ()
     code = "T041"
     severity = "info"
     handles = (ast.AnnAssign,)
 
     def check(self, node: ast.AnnAssign, ctx: RuleContext):  # type: ignore[override]
-        if not ctx.in_device_class or not isinstance(node.target, ast.Name):
+        if not ctx.in_device_class or not isinstance(node.target, _Name):
             return
-        if not (isinstance(node.value, ast.Call) and "device_property" in get_name(node.value.func)):
+        if not (
+            isinstance(node.value, _Call)
+            and "device_property" in get_name(node.value.func, ctx.name_cache)
+        ):
             return
         if not any(kw.arg == 'doc' for kw in node.value.keywords):
-            yield node, f"Device property '{node.target.id}' should have a 'doc' parameter"
+            return [(
+                node,
+                f"Device property '{node.target.id}' should have a 'doc' parameter",
+            )]
 
 class T042_MissingInitDevice(ASTRule):
     """Tango device class should define init_device() to initialise internal state."""
 
+    __slots__ = ()
     code = "T042"
     severity = "info"
     handles = (ast.ClassDef,)
@@ -426,45 +805,46 @@ class T042_MissingInitDevice(ASTRule):
     def check(self, node: ast.ClassDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class:
             return
-        method_names = {
-            item.name
-            for item in node.body
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
-        }
-        if 'init_device' not in method_names:
-            yield node, (
+        if 'init_device' not in ctx.method_names:
+            return [(
+                node,
                 f"Device class '{node.name}' does not define init_device(); "
-                "consider overriding it to initialise internal state"
-            )
+                "consider overriding it to initialise internal state",
+            )]
 
 class T043_DelUsedInDevice(ASTRule):
     """__del__() is unreliable in Tango; use delete_device() to release resources."""
 
+    __slots__ = ()
     code = "T043"
     severity = "warning"
     handles = (ast.FunctionDef,)
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if ctx.in_device_class and node.name == '__del__':
-            yield node, (
+            return [(
+                node,
                 f"Device class '{ctx.current_class}' defines __del__(); "
-                "use delete_device() to release resources instead"
-            )
+                "use delete_device() to release resources instead",
+            )]
 
 class T044_AttributeMissingLabel(ASTRule):
     """Tango @attribute should have a 'label' parameter for the control-system UI."""
 
+    __slots__ = ()
     code = "T044"
     severity = "info"
     handles = (ast.FunctionDef,)
+    requires_tango_attribute = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
-        if ctx.is_tango_attribute and 'label' not in ctx.attribute_config:
-            yield node, f"Attribute '{node.name}' should have a 'label' parameter"
+        if ctx.is_tango_attribute and not ctx.attribute_config.has_label:
+            return [(node, f"Attribute '{node.name}' should have a 'label' parameter")]
 
 class T045_ReadWriteMissingWriter(ASTRule):
     """READ_WRITE @attribute should have a corresponding write_<name>() method."""
 
+    __slots__ = ()
     code = "T045"
     severity = "warning"
     handles = (ast.ClassDef,)
@@ -472,26 +852,26 @@ class T045_ReadWriteMissingWriter(ASTRule):
     def check(self, node: ast.ClassDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class:
             return
-        method_names = {
-            item.name
-            for item in node.body
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
-        }
+        method_names = ctx.method_names
+        hits = []
         for item in node.body:
-            if not isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if not isinstance(item, _Func):
                 continue
             for dec in item.decorator_list:
                 if _has_read_write_access(dec):
                     write_name = f'write_{item.name}'
                     if write_name not in method_names:
-                        yield item, (
+                        hits.append((
+                            item,
                             f"READ_WRITE attribute '{item.name}' is missing "
-                            f"'{write_name}()' method"
-                        )
+                            f"'{write_name}()' method",
+                        ))
+        return hits
 
 class T046_SleepInDevice(ASTRule):
     """time.sleep() inside a device method blocks the Tango event loop."""
 
+    __slots__ = ()
     code = "T046"
     severity = "warning"
     handles = (ast.FunctionDef,)
@@ -499,21 +879,20 @@ class T046_SleepInDevice(ASTRule):
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class:
             return
-        for child in ast.walk(node):
-            if not isinstance(child, ast.Call):
-                continue
-            name = get_name(child.func)
-            if name in ('sleep', 'time.sleep'):
-                yield child, (
-                    f"time.sleep() in '{node.name}' blocks the Tango event loop; "
-                    "use a non-blocking approach or green mode"
-                )
-                return  # one warning per function is enough
+        # One warning per function is enough.
+        child = _function_summary(node, ctx).sleep_call
+        if child is not None:
+            return [(
+                child,
+                f"time.sleep() in '{node.name}' blocks the Tango event loop; "
+                "use a non-blocking approach or green mode",
+            )]
 
 
 class T047_ThreadingInDevice(ASTRule):
     """threading.Thread in a device class; prefer Tango green mode or DeviceThread."""
 
+    __slots__ = ()
     code = "T047"
     severity = "warning"
     handles = (ast.FunctionDef,)
@@ -521,20 +900,18 @@ class T047_ThreadingInDevice(ASTRule):
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class:
             return
-        for child in ast.walk(node):
-            if not isinstance(child, ast.Call):
-                continue
-            name = get_name(child.func)
-            if 'Thread' in name and ('threading' in name or name == 'Thread'):
-                yield child, (
-                    f"threading.Thread in '{node.name}'; "
-                    "prefer Tango green mode or tango.utils.DeviceThread"
-                )
-                return
+        child = _function_summary(node, ctx).thread_call
+        if child is not None:
+            return [(
+                child,
+                f"threading.Thread in '{node.name}'; "
+                "prefer Tango green mode or tango.utils.DeviceThread",
+            )]
 
 class T049_CommandMissingDtypes(ASTRule):
     """@command with arguments or a return value should declare dtype_in / dtype_out."""
 
+    __slots__ = ()
     code = "T049"
     severity = "info"
     handles = (ast.FunctionDef,)
@@ -542,25 +919,33 @@ class T049_CommandMissingDtypes(ASTRule):
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.is_tango_command:
             return
+        n_params = len(node.args.args) - 1  # subtract self
+        if n_params <= 0 and node.returns is None:
+            return
 
         # Resolve the command decorator's kwargs from the node directly,
         # since ctx.attribute_config is only populated for @attribute.
-        cmd_kwargs: dict = {}
+        # Match on the name first; only the @command decorator's kwargs
+        # are ever collected.
+        cmd_kwargs: Mapping[str, Any] = EMPTY_CONFIG
         for dec in node.decorator_list:
-            info = get_decorator_info(dec)
-            if info and 'command' in info[0]:
-                cmd_kwargs = info[1]
+            if decorator_kind(dec, ctx.name_cache) == 'command':
+                if isinstance(dec, _Call):
+                    cmd_kwargs = get_call_kwargs(dec)
                 break
 
-        n_params = len(node.args.args) - 1  # subtract self
+        hits = []
         if n_params > 0 and 'dtype_in' not in cmd_kwargs:
-            yield node, (
-                f"Command '{node.name}' takes arguments but is missing 'dtype_in' declaration"
-            )
+            hits.append((
+                node,
+                f"Command '{node.name}' takes arguments but is missing 'dtype_in' declaration",
+            ))
         if node.returns is not None and 'dtype_out' not in cmd_kwargs:
-            yield node, (
-                f"Command '{node.name}' has a return annotation but is missing 'dtype_out' declaration"
-            )
+            hits.append((
+                node,
+                f"Command '{node.name}' has a return annotation but is missing 'dtype_out' declaration",
+            ))
+        return hits
 
 
 # # # # # # # # # # # # # # # # # # # # # # # # # # # #
@@ -574,61 +959,75 @@ class T049_CommandMissingDtypes(ASTRule):
 class G001_BareExcept(ASTRule):
     """Bare except clause catches every exception; specify the type."""
 
+    __slots__ = ()
     code = "G001"
     severity = "warning"
     handles = (ast.ExceptHandler,)
 
     def check(self, node: ast.ExceptHandler, ctx: RuleContext):  # type: ignore[override]
         if node.type is None:
-            yield node, (
-                "Bare except clause catches all exceptions; specify the exception type"
-            )
+            return [(
+                node,
+                "Bare except clause catches all exceptions; specify the exception type",
+            )]
 
 class G002_EmptyExcept(ASTRule):
     """Empty except block silently swallows exceptions."""
 
+    __slots__ = ()
     code = "G002"
     severity = "warning"
     handles = (ast.ExceptHandler,)
 
     def check(self, node: ast.ExceptHandler, ctx: RuleContext):  # type: ignore[override]
         if len(node.body) == 1 and isinstance(node.body[0], ast.Pass):
-            yield node, (
+            return [(
+                node,
                 "Empty except block silently swallows exceptions; "
-                "add error handling or a comment"
-            )
+                "add error handling or a comment",
+            )]
 
 class G003_SingletonComparison(ASTRule):
     """Use 'is'/'is not' when comparing against None, True, or False."""
 
+    __slots__ = ()
     code = "G003"
     severity = "warning"
     handles = (ast.Compare,)
 
-    @staticmethod
-    def _message(op: ast.cmpop, val: Any) -> str | None:
-        if val is not None and val is not True and val is not False:
-            return None
-        name = repr(val)
-        if isinstance(op, ast.Eq):
-            return f"Use 'is {name}' instead of '== {name}'"
-        if isinstance(op, ast.NotEq):
-            return f"Use 'is not {name}' instead of '!= {name}'"
-        return None
+    # Every message this rule can emit, keyed by (operator type, id(value)).
+    # Keying on id() is safe for the None/True/False singletons and keeps
+    # 1 and 0 from matching True and False the way equality would.
+    _MESSAGES = {
+        (op_type, id(val)): f"Use '{word} {val!r}' instead of '{symbol} {val!r}'"
+        for op_type, word, symbol in (
+            (ast.Eq, "is", "=="),
+            (ast.NotEq, "is not", "!="),
+        )
+        for val in (None, True, False)
+    }
 
     def check(self, node: ast.Compare, ctx: RuleContext):  # type: ignore[override]
-        for op, comparator in zip(node.ops, node.comparators):
-            if isinstance(comparator, ast.Constant):
-                if msg := self._message(op, comparator.value):
-                    yield node, msg
+        # The table lookup is also the singleton test: anything but
+        # None/True/False compared with ==/!= simply misses.
+        message_for = self._MESSAGES.get
+        hits = [
+            (node, msg)
+            for op, comparator in zip(node.ops, node.comparators)
+            if type(comparator) is _Constant
+            and (msg := message_for((type(op), id(comparator.value))))
+        ]
         # Also catch the reversed form: None == x, True != x, etc.
-        if isinstance(node.left, ast.Constant) and node.ops:
-            if msg := self._message(node.ops[0], node.left.value):
-                yield node, msg
+        left = node.left
+        if type(left) is _Constant and node.ops:
+            if msg := message_for((type(node.ops[0]), id(left.value))):
+                hits.append((node, msg))
+        return hits
 
 class G004_MutableDefault(ASTRule):
     """Mutable default argument; use None and initialise inside the function."""
 
+    __slots__ = ()
     code = "G004"
     severity = "warning"
     handles = (ast.FunctionDef,)
@@ -638,16 +1037,19 @@ class G004_MutableDefault(ASTRule):
             d for d in node.args.kw_defaults if d is not None
         ]
         for default in all_defaults:
-            if isinstance(default, (ast.List, ast.Dict, ast.Set)):
-                yield node, (
+            if isinstance(default, _Mutable):
+                # One warning per function is enough.
+                return [(
+                    node,
                     f"Mutable default argument in '{node.name}'; "
-                    "use None and initialise inside the function"
-                )
-                return  # one warning per function is enough
+                    "use None and initialise inside the function",
+                )]
+        return None
 
 class G005_StarImport(ASTRule):
     """Star import pollutes the namespace; import names explicitly."""
 
+    __slots__ = ()
     code = "G005"
     severity = "warning"
     handles = (ast.ImportFrom,)
@@ -655,61 +1057,72 @@ class G005_StarImport(ASTRule):
     def check(self, node: ast.ImportFrom, ctx: RuleContext):  # type: ignore[override]
         for alias in node.names:
             if alias.name == "*":
-                yield node, (
+                # '*' can only appear on its own.
+                return [(
+                    node,
                     f"Star import 'from {node.module} import *' "
-                    "pollutes the namespace; import names explicitly"
-                )
+                    "pollutes the namespace; import names explicitly",
+                )]
+        return None
 
 
 class G006_MultipleImports(ASTRule):
     """Multiple modules on one import line; use separate statements."""
 
+    __slots__ = ()
     code = "G006"
     severity = "info"
     handles = (ast.Import,)
 
     def check(self, node: ast.Import, ctx: RuleContext):  # type: ignore[override]
         if len(node.names) > 1:
-            yield node, (
+            return [(
+                node,
                 "Multiple imports on one line; "
-                "use a separate import statement for each module"
-            )
+                "use a separate import statement for each module",
+            )]
 
 
 class G007_LineTooLong(SourceRule):
     """Line exceeds the maximum allowed length."""
 
+    __slots__ = ()
     code = "G007"
     severity = "info"
     max_length: int = 88
 
     def check_source(self, source: str):  # type: ignore[override]
-        for lineno, line in enumerate(source.splitlines(), start=1):
-            length = len(line.rstrip("\r\n"))
-            if length > self.max_length:
-                yield lineno, self.max_length + 1, (
-                    f"Line too long ({length} > {self.max_length} characters)"
+        return self.check(SourceContext(source))
+
+    def check(self, src: SourceContext):  # type: ignore[override]
+        limit = self.max_length
+        # splitlines() already drops the line terminators, so the lengths can
+        # be taken in C via map(len, ...) with no per-line rstrip().
+        for lineno, length in enumerate(map(len, src.lines), start=1):
+            if length > limit:
+                yield lineno, limit + 1, (
+                    f"Line too long ({length} > {limit} characters)"
                 )
 
 
 class G008_PrintInDeviceMethod(ASTRule):
     """print() in a device class method; use Tango stream methods instead."""
 
+    __slots__ = ()
     code = "G008"
     severity = "info"
     handles = (ast.FunctionDef,)
+    requires_device_class = True
 
     def check(self, node: ast.FunctionDef, ctx: RuleContext):  # type: ignore[override]
         if not ctx.in_device_class:
             return
-        for child in ast.walk(node):
-            if (
-                isinstance(child, ast.Call)
-                and isinstance(child.func, ast.Name)
-                and child.func.id == "print"
-            ):
-                yield child, (
-                    f"print() in device method '{node.name}'; "
-                    "use Tango stream methods "
-                    "(self.debug_stream, self.info_stream, etc.) instead"
-                )
+        return [
+            (
+                child,
+                f"print() in device method '{node.name}'; "
+                "use Tango stream methods "
+                "(self.debug_stream, self.info_stream, etc.) instead",
+            )
+            for child in _function_summary(node, ctx).print_calls
+        ]
@@ -0,0 +1,25 @@
+import tango.server as ts
+
+
+# Decorators used through a module alias must still be recognised.
+# T020, T021, T023, T024, T025, T044: aliased @attribute
+# T030, T031, T049: aliased @command
+class AliasDevice(ts.Device):
+
+    def init_device(self):
+        super().init_device()
+        self._temperature = 0.0
+
+    @ts.attribute(dtype=float)
+    def temperature(self):
+        value = self._temperature
+        return value
+
+    @ts.command
+    def reset_value(self, value):
+        self._temperature = value
+
+    # Not a Tango decorator: only the last name segment counts.
+    @my_attribute_helper
+    def helper(self):
+        pass